@@ -1,15 +1,30 @@
 
-import os 
-import dotenv
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 
-dotenv.load_dotenv()
+import dotenv
 
+# Load .env once per process; repeat imports skip the file I/O
+if not os.environ.get("_DOTENV_LOADED"):
+    dotenv.load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    def __init__(self):
-        self.openai_api_key = os.getenv('OPENAI_API_KEY')
-        self.pinecone_api_key = os.getenv('PINECONE_API_KEY')
-        self.embedding_dimension = int(os.getenv('EMBEDDING_DIMENSIONS', '3072'))
-        self.embedding_model = os.getenv('EMBEDDING_MODEL', 'text-embedding-3-large')
-      
\ No newline at end of file
+    openai_api_key: str | None
+    pinecone_api_key: str | None
+    embedding_dimension: int
+    embedding_model: str
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Read environment variables once and return the shared Config instance."""
+    return Config(
+        openai_api_key=os.getenv('OPENAI_API_KEY'),
+        pinecone_api_key=os.getenv('PINECONE_API_KEY'),
+        embedding_dimension=int(os.getenv('EMBEDDING_DIMENSIONS', '3072')),
+        embedding_model=os.getenv('EMBEDDING_MODEL', 'text-embedding-3-large'),
+    )
@@ -2,236 +2,144 @@
 AI prompt templates for enhanced MCP server interactions
 """
 
-# Define prompt dictionaries at module level
-SYSTEM_PROMPTS = {
-    "main": """
-    You are a FastMCP server assistant with access to powerful tools for:
-    
-    1. **Pinecone Vector Database Operations**
-       - Create, manage, and query vector indexes
-       - Store and retrieve documents with semantic search
-       - Manage namespaces and metadata
-    
-    2. **RAG (Retrieval-Augmented Generation)**
-       - Document storage with embeddings
-       - Semantic search and retrieval
-       - Content analysis and summarization
-    
-    3. **Mathematical Operations**
-       - Basic arithmetic operations
-       - Mathematical computations
-    
-    **Best Practices:**
-    - Always validate inputs before processing
-    - Handle errors gracefully with informative messages
-    - Use appropriate tools for the task at hand
-    - Provide clear, structured responses
-    """,
-    
-    "error_handling": """
-    When encountering errors:
-    1. Log the error with context
-    2. Provide user-friendly error messages
-    3. Suggest alternative approaches
-    4. Maintain system stability
-    """
-}
+from functools import lru_cache
+from importlib.resources import files
+from types import MappingProxyType
 
-TOOL_PROMPTS = {
-    "pinecone_retrieve": """
-    **Pinecone Document Retrieval Tool**
-    
-    **Purpose**: Retrieve documents from Pinecone using semantic search
-    
-    **Input Format**:
-    - index_name: String (required) - Name of the Pinecone index
-    - namespace: String (optional) - Namespace to search in (use "" for default)
-    - query: String (required) - Search query text
-    - top_k: Integer (default: 5) - Number of results to return
-    
-    **Example Usage**:
-    ```python
-    await pinecone_retrieve(
-        index_name="my-documents",
-        namespace="",
-        query="machine learning algorithms",
-        top_k=10
-    )
-    ```
-    
-    **Expected Output**:
-    - success: Boolean indicating operation status
-    - content: List of retrieved documents with scores
-    - total_results: Number of results found
-    - query_info: Search metadata
-    
-    **Best Practices**:
-    - Use descriptive, specific queries for better results
-    - Start with small top_k values and increase as needed
-    - Check index existence before querying
-    """,
-    
-    "pinecone_store": """
-    **Pinecone Document Storage Tool**
-    
-    **Purpose**: Store documents in Pinecone with embeddings
-    
-    **Input Format**:
-    - index_name: String (required) - Target index name
-    - namespace: String (optional) - Target namespace
-    - documents: List[Dict] (required) - Documents to store
-    
-    **Document Structure**:
-    ```python
-    {
-        "id": "unique_document_id",
-        "content": "document text content",
-        "metadata": {
-            "source": "document.pdf",
-            "title": "Document Title",
-            "author": "Author Name",
-            "page_number": "1",
-            "section": "introduction"
-        }
-    }
-    ```
-    
-    **Best Practices**:
-    - Use unique, descriptive document IDs
-    - Include rich metadata for better searchability
-    - Ensure content is properly formatted
-    - Validate index exists before storing
-    """
-}
+# Prompt text lives in src/prompts/text/*.md so the module source stays small
+# and each body is read from disk exactly once at import. The dicts are
+# wrapped in read-only MappingProxyType so the constants can't be mutated at
+# runtime.
+_TEXT = files("src.prompts") / "text"
 
-WORKFLOW_PROMPTS = {
-    "rag_pipeline": """
-    **RAG (Retrieval-Augmented Generation) Pipeline**
-    
-    **Workflow Steps**:
-    1. **Document Ingestion**
-       - Validate document format and content
-       - Extract text and metadata
-       - Generate embeddings using OpenAI
-    
-    2. **Storage**
-       - Store documents in Pinecone index
-       - Verify successful storage
-       - Update metadata and tracking
-    
-    3. **Retrieval**
-       - Process user query
-       - Generate query embeddings
-       - Perform semantic search
-       - Rank and filter results
-    
-    4. **Response Generation**
-       - Format retrieved content
-       - Add context and metadata
-       - Provide structured response
-    
-    **Error Handling**:
-    - Handle embedding generation failures
-    - Manage Pinecone connection issues
-    - Provide fallback responses
-    """,
-    
-    "index_management": """
-    **Pinecone Index Management Workflow**
-    
-    **Index Lifecycle**:
-    1. **Creation**: Create index with proper dimensions
-    2. **Population**: Store initial documents
-    3. **Monitoring**: Track usage and performance
-    4. **Maintenance**: Update and optimize
-    5. **Cleanup**: Delete when no longer needed
-    
-    **Best Practices**:
-    - Use descriptive index names
-    - Monitor index size and performance
-    - Implement proper cleanup procedures
-    - Document index purposes and contents
-    """
-}
+
+def _read(name: str) -> str:
+    return (_TEXT / name).read_text(encoding="utf-8")
+
+
+SYSTEM_PROMPTS = MappingProxyType({
+    "main": _read("system_main.md"),
+    "error_handling": _read("system_error_handling.md"),
+})
+
+TOOL_PROMPTS = MappingProxyType({
+    "pinecone_retrieve": _read("tool_pinecone_retrieve.md"),
+    "pinecone_store": _read("tool_pinecone_store.md"),
+})
+
+WORKFLOW_PROMPTS = MappingProxyType({
+    "rag_pipeline": _read("workflow_rag_pipeline.md"),
+    "index_management": _read("workflow_index_management.md"),
+})
 
 # Intelligent RAG Prompts for Automatic Retrieval
-INTELLIGENT_RAG_PROMPTS = {
-    "auto_retrieval_agent": """
-    **Intelligent Document Retrieval Agent**
-    
-    **Role**: You are an intelligent document retrieval agent that automatically determines when to fetch relevant information from vector databases.
-    
-    **Automatic Triggers**: Detect and respond to these query types:
-    - Questions asking for specific information: "What is X?", "How does Y work?", "Tell me about Z"
-    - Research queries: "Find information about...", "Show me data on...", "Research..."
-    - Comparison requests: "Compare A and B", "What's the difference between..."
-    - Explanation requests: "Explain how...", "Why does...", "What causes..."
-    - Analysis requests: "Analyze...", "Summarize...", "Review..."
-    - Code-related queries: "Show me examples of...", "How to implement..."
-    
-    **Decision Logic**:
-    1. If query contains knowledge-seeking words → Use pinecone_retrieve
-    2. If query asks for recent/specific data → Use pinecone_retrieve with targeted search
-    3. If query is conversational/greeting → Respond directly without retrieval
-    4. If query asks to store/save → Use pinecone_store
-    
-    **Default Settings**:
-    - index_name: "main-knowledge" (or user-specified)
-    - namespace: "" (default namespace)
-    - top_k: 5 (adjust based on query complexity)
-    
-    **Response Format**: Always provide sources and confidence scores from retrieval results.
-    """,
-    
-    "context_aware_search": """
-    **Context-Aware Search Strategy**
-    
-    **Query Enhancement**: Before searching, enhance user queries:
-    - Extract key entities and concepts
-    - Identify search intent (factual, procedural, comparative, etc.)
-    - Add relevant synonyms and related terms
-    - Consider conversation context for disambiguation
-    
-    **Search Optimization**:
-    - Use multiple search strategies for complex queries
-    - Combine semantic and keyword approaches
-    - Adjust retrieval parameters based on query type:
-      * Simple facts: top_k=3, focused search
-      * Complex topics: top_k=10, broad search
-      * Comparisons: top_k=8, balanced coverage
-    
-    **Result Processing**:
-    - Filter results by relevance score (>0.7 for high confidence)
-    - Deduplicate similar content
-    - Rank by context relevance
-    - Synthesize information from multiple sources
-    """,
-    
-    "adaptive_retrieval": """
-    **Adaptive Retrieval System**
-    
-    **Smart Namespace Selection**:
-    - Analyze query to determine domain (technical, business, general, etc.)
-    - Route to appropriate namespace automatically:
-      * Technical queries → "technical" namespace
-      * Business questions → "business" namespace  
-      * General knowledge → "" (default) namespace
-      * Code examples → "code" namespace
-    
-    **Dynamic Parameter Adjustment**:
-    - Query complexity detection:
-      * Simple: top_k=3, single namespace
-      * Medium: top_k=5-7, consider multiple namespaces
-      * Complex: top_k=10, multi-namespace search with ranking
-    
-    **Follow-up Strategy**:
-    - If initial results are insufficient (low scores), try:
-      1. Broader search terms
-      2. Different namespace
-      3. Increased top_k
-      4. Alternative query formulations
-    """
-}
+INTELLIGENT_RAG_PROMPTS = MappingProxyType({
+    "auto_retrieval_agent": _read("intelligent_rag_auto_retrieval_agent.md"),
+    "context_aware_search": _read("intelligent_rag_context_aware_search.md"),
+    "adaptive_retrieval": _read("intelligent_rag_adaptive_retrieval.md"),
+})
+
+# Precomputed prompt strings - built once at import so prompt fetches
+# don't re-join the dictionaries on every call
+_SYSTEM_MAIN = SYSTEM_PROMPTS["main"]
+_TOOL_PROMPT_JOINED = "\n\n".join(TOOL_PROMPTS.values())
+_WORKFLOW_PROMPT_JOINED = "\n\n".join(WORKFLOW_PROMPTS.values())
+
+# Static template bodies for the intelligent RAG prompts - hoisted to module
+# scope so each call only runs a single format_map pass instead of rebuilding
+# the multi-KB string from f-string pieces
+_AUTO_RETRIEVAL_TPL = """
+        **AUTOMATIC RAG RETRIEVAL WORKFLOW**
+
+        **User Query**: "{query}"
+        **Target Index**: "{index_name}"
+
+        **INSTRUCTIONS**:
+
+        1. **INTENT ANALYSIS** - Analyze this query for retrieval triggers:
+           - Knowledge Questions: "what is", "how does", "tell me about", "explain"
+           - Research Requests: "find", "search", "lookup", "get information"
+           - Specific Data: "show me", "give me details", "provide data"
+           - Analysis: "analyze", "compare", "review", "summarize"
+           - Examples: "show examples", "give me samples", "demonstrate"
+
+        2. **AUTOMATIC DECISION**:
+           IF query matches ANY trigger patterns:
+           → **RETRIEVE DOCUMENTS** using pinecone_retrieve with these parameters:
+             - index_name: "{index_name}"
+             - namespace: "" (auto-detect from query domain)
+             - query: "{query}"
+             - top_k: 5-10 (based on complexity)
+
+           IF query is conversational/greeting/simple:
+           → **RESPOND DIRECTLY** without retrieval
+
+        3. **ENHANCEMENT LOGIC**:
+           - Extract key terms from: "{query}"
+           - Add relevant synonyms and context
+           - Consider conversation history for disambiguation
+
+        4. **RESPONSE SYNTHESIS**:
+           - Use retrieved documents as primary source
+           - Cite sources with confidence scores
+           - Provide comprehensive answers
+           - Suggest related topics if relevant
+
+        **EXECUTE NOW**: Apply this workflow to the current query automatically.
+        """
+
+_SMART_SEARCH_TPL = """
+        **SMART SEARCH OPTIMIZATION**
+
+        **Query Analysis**:
+        - Original: "{query}"
+        - Domain: {domain_hint}
+        - Complexity: {complexity} ({word_count} words)
+        - Technical: {has_technical_terms}
+
+        **Optimized Parameters**:
+        - top_k: {top_k}
+        - namespace: {namespace}
+        - search_strategy: {search_strategy}
+
+        **Search Enhancement**:
+        1. Extract key entities from query
+        2. Add domain-specific context
+        3. Include relevant synonyms
+        4. Optimize for {domain_hint} domain
+
+        **Execute Search**: Use pinecone_retrieve with optimized parameters automatically.
+        """
+
+_CONVERSATIONAL_RAG_TPL = """
+        **CONVERSATIONAL RAG WORKFLOW**
+
+        **Current Query**: "{current_query}"
+        **Context**: {context}
+
+        **CONTEXTUAL ANALYSIS**:
+        1. **Reference Resolution**: Check if query refers to previous topics
+        2. **Intent Continuity**: Determine if this extends previous discussion
+        3. **Context Integration**: Use conversation history to enhance search
+
+        **RETRIEVAL STRATEGY**:
+        - If query references "that", "it", "this" → Use conversation context
+        - If query is follow-up question → Combine with previous topics
+        - If query is new topic → Fresh retrieval with full query
+
+        **RESPONSE INTEGRATION**:
+        - Maintain conversation flow and tone
+        - Reference previous exchanges when relevant
+        - Provide context-aware explanations
+        - Build upon established knowledge
+
+        **AUTOMATIC EXECUTION**: Apply contextual retrieval strategy now.
+        """
+
+# Technical-term check for smart_search_prompt - frozen at module scope so the
+# per-call work is one lowercase pass plus membership tests
+_TECH_TERMS = frozenset({'api', 'function', 'class', 'algorithm', 'code', 'implementation'})
+
 
 def register_prompts(mcp):
     """
@@ -246,7 +154,6 @@ def register_prompts(mcp):
         mcp: The FastMCP server instance to register prompts with
     """
     
-    @mcp.prompt("system_prompt", description="System-level prompts defining server capabilities and behavior")
     def system_prompt() -> str:
         """
         MCP System Prompt Function
@@ -268,9 +175,8 @@ def register_prompts(mcp):
             - Sets guidelines for error handling and user communication
             - Provides structured response expectations
         """
-        return SYSTEM_PROMPTS["main"]
+        return _SYSTEM_MAIN
     
-    @mcp.prompt("tool_prompt", description="Tool-specific prompts with usage guidance and examples")
     def tool_prompt() -> str:
         """
         MCP Tool Prompt Function
@@ -297,9 +203,8 @@ def register_prompts(mcp):
             - Best practices and optimization tips
             - Error handling recommendations
         """
-        return "\n\n".join(TOOL_PROMPTS.values())
+        return _TOOL_PROMPT_JOINED
     
-    @mcp.prompt("workflow_prompt", description="Workflow prompts for complex multi-step operations")
     def workflow_prompt() -> str:
         """
         MCP Workflow Prompt Function
@@ -325,10 +230,12 @@ def register_prompts(mcp):
             - Performance and cost considerations
             - Maintenance and monitoring recommendations
         """
-        return "\n\n".join(WORKFLOW_PROMPTS.values())
+        return _WORKFLOW_PROMPT_JOINED
     
     # Intelligent RAG Prompts for Automatic Retrieval
-    @mcp.prompt("auto_retrieval", description="Automatically trigger RAG retrieval based on user intent")
+    # The builders are pure functions of their arguments, so repeat fetches
+    # for the same query return the cached string instead of re-formatting
+    @lru_cache(maxsize=256)
     def auto_retrieval_prompt(query: str, index_name: str = "main-knowledge") -> str:
         """
         Intelligent Auto-Retrieval Prompt
@@ -344,47 +251,9 @@ def register_prompts(mcp):
         Returns:
             str: Instructions for automatic retrieval workflow
         """
-        return f"""
-        **AUTOMATIC RAG RETRIEVAL WORKFLOW**
-        
-        **User Query**: "{query}"
-        **Target Index**: "{index_name}"
-        
-        **INSTRUCTIONS**:
-        
-        1. **INTENT ANALYSIS** - Analyze this query for retrieval triggers:
-           - Knowledge Questions: "what is", "how does", "tell me about", "explain"
-           - Research Requests: "find", "search", "lookup", "get information"  
-           - Specific Data: "show me", "give me details", "provide data"
-           - Analysis: "analyze", "compare", "review", "summarize"
-           - Examples: "show examples", "give me samples", "demonstrate"
-        
-        2. **AUTOMATIC DECISION**:
-           IF query matches ANY trigger patterns:
-           → **RETRIEVE DOCUMENTS** using pinecone_retrieve with these parameters:
-             - index_name: "{index_name}"
-             - namespace: "" (auto-detect from query domain)
-             - query: "{query}"  
-             - top_k: 5-10 (based on complexity)
-           
-           IF query is conversational/greeting/simple:
-           → **RESPOND DIRECTLY** without retrieval
-        
-        3. **ENHANCEMENT LOGIC**:
-           - Extract key terms from: "{query}"
-           - Add relevant synonyms and context
-           - Consider conversation history for disambiguation
-           
-        4. **RESPONSE SYNTHESIS**:
-           - Use retrieved documents as primary source
-           - Cite sources with confidence scores
-           - Provide comprehensive answers
-           - Suggest related topics if relevant
-        
-        **EXECUTE NOW**: Apply this workflow to the current query automatically.
-        """
+        return _AUTO_RETRIEVAL_TPL.format_map({"query": query, "index_name": index_name})
     
-    @mcp.prompt("smart_search", description="Context-aware search with automatic parameter optimization")
+    @lru_cache(maxsize=256)
     def smart_search_prompt(query: str, domain_hint: str = "general") -> str:
         """
         Smart Search Optimization Prompt
@@ -399,46 +268,34 @@ def register_prompts(mcp):
         Returns:
             str: Optimized search instructions
         """
-        
-        # Analyze query complexity
-        word_count = len(query.split())
-        has_technical_terms = any(term in query.lower() for term in 
-                                ['api', 'function', 'class', 'algorithm', 'code', 'implementation'])
-        
+
+        # Analyze query complexity (count spaces instead of materializing a
+        # word list - only the count is needed)
+        q_lower = query.lower()
+        word_count = query.count(' ') + 1
+        has_technical_terms = any(term in q_lower for term in _TECH_TERMS)
+
         if word_count <= 3:
             complexity = "simple"
             top_k = 3
         elif word_count <= 8:
-            complexity = "medium" 
+            complexity = "medium"
             top_k = 5
         else:
             complexity = "complex"
             top_k = 10
-            
-        return f"""
-        **SMART SEARCH OPTIMIZATION**
-        
-        **Query Analysis**:
-        - Original: "{query}"
-        - Domain: {domain_hint}
-        - Complexity: {complexity} ({word_count} words)
-        - Technical: {has_technical_terms}
-        
-        **Optimized Parameters**:
-        - top_k: {top_k}
-        - namespace: {"technical" if has_technical_terms else ""}
-        - search_strategy: {"focused" if complexity == "simple" else "comprehensive"}
-        
-        **Search Enhancement**:
-        1. Extract key entities from query
-        2. Add domain-specific context
-        3. Include relevant synonyms
-        4. Optimize for {domain_hint} domain
-        
-        **Execute Search**: Use pinecone_retrieve with optimized parameters automatically.
-        """
+
+        return _SMART_SEARCH_TPL.format_map({
+            "query": query,
+            "domain_hint": domain_hint,
+            "complexity": complexity,
+            "word_count": word_count,
+            "has_technical_terms": has_technical_terms,
+            "top_k": top_k,
+            "namespace": "technical" if has_technical_terms else "",
+            "search_strategy": "focused" if complexity == "simple" else "comprehensive",
+        })
     
-    @mcp.prompt("conversational_rag", description="Maintain conversation context while performing retrieval")  
     def conversational_rag_prompt(current_query: str, conversation_context: str = "") -> str:
         """
         Conversational RAG Prompt
@@ -453,30 +310,32 @@ def register_prompts(mcp):
         Returns:
             str: Contextual retrieval instructions
         """
-        return f"""
-        **CONVERSATIONAL RAG WORKFLOW**
-        
-        **Current Query**: "{current_query}"
-        **Context**: {conversation_context[:200]}{"..." if len(conversation_context) > 200 else ""}
-        
-        **CONTEXTUAL ANALYSIS**:
-        1. **Reference Resolution**: Check if query refers to previous topics
-        2. **Intent Continuity**: Determine if this extends previous discussion
-        3. **Context Integration**: Use conversation history to enhance search
-        
-        **RETRIEVAL STRATEGY**:
-        - If query references "that", "it", "this" → Use conversation context
-        - If query is follow-up question → Combine with previous topics  
-        - If query is new topic → Fresh retrieval with full query
-        
-        **RESPONSE INTEGRATION**:
-        - Maintain conversation flow and tone
-        - Reference previous exchanges when relevant
-        - Provide context-aware explanations
-        - Build upon established knowledge
-        
-        **AUTOMATIC EXECUTION**: Apply contextual retrieval strategy now.
-        """
-    
+        # Truncate once: short contexts pass through untouched, long ones pay
+        # for a single 200-char slice. Caching happens on the truncated
+        # context so long histories can't blow up the cache key space.
+        ctx_len = len(conversation_context)
+        truncated = conversation_context if ctx_len <= 200 else conversation_context[:200] + "..."
+        return _conversational_rag_cached(current_query, truncated)
+
+    @lru_cache(maxsize=256)
+    def _conversational_rag_cached(current_query: str, truncated: str) -> str:
+        return _CONVERSATIONAL_RAG_TPL.format_map({
+            "current_query": current_query,
+            "context": truncated,
+        })
+
+    # Batched registration - one loop over the specs instead of a separate
+    # decorator application per prompt
+    prompt_specs = [
+        ("system_prompt", "System-level prompts defining server capabilities and behavior", system_prompt),
+        ("tool_prompt", "Tool-specific prompts with usage guidance and examples", tool_prompt),
+        ("workflow_prompt", "Workflow prompts for complex multi-step operations", workflow_prompt),
+        ("auto_retrieval", "Automatically trigger RAG retrieval based on user intent", auto_retrieval_prompt),
+        ("smart_search", "Context-aware search with automatic parameter optimization", smart_search_prompt),
+        ("conversational_rag", "Maintain conversation context while performing retrieval", conversational_rag_prompt),
+    ]
+    for name, description, fn in prompt_specs:
+        mcp.prompt(name, description=description)(fn)
+
 
 
@@ -3,25 +3,32 @@
 from mcp.server.fastmcp import FastMCP
 from .tools import register_math_tools, register_resources, pinecone_config, rag_retrival, rag_store
 from .tools.intelligent_retrieval import intelligent_retrieval_coordinator
-from .prompts.templates import register_prompts
+from .prompts import register_prompts
+from .tools.pinecone_tools._client import warm_channel
 from src.tools import web_search_tools
 # from src.tools.sql_database_tools.basic_sql import basic_mcp
 
 # Create FastMCP server
 mcp = FastMCP("FastMCP Server")
 
-# Register prompts
+# Everything to register at startup - prompts first, then tools/resources
+REGISTRARS = [
+    register_prompts,
+    register_math_tools,
+    register_resources,
+    pinecone_config,
+    rag_retrival,
+    rag_store,
+    intelligent_retrieval_coordinator,  # New intelligent retrieval system
+    web_search_tools,
+]
 
-register_prompts(mcp)
+for registrar in REGISTRARS:
+    registrar(mcp)
 
-# Register all tools and resources
-register_math_tools(mcp)
-register_resources(mcp)
-pinecone_config(mcp)
-rag_retrival(mcp)
-rag_store(mcp)
-intelligent_retrieval_coordinator(mcp)  # New intelligent retrieval system
-web_search_tools(mcp)
+# Pay the Pinecone TLS/HTTP2 handshake in the background during startup
+# rather than on the first user query
+warm_channel()
 
 if __name__ == "__main__":
     # print("Starting FastMCP Server on http://localhost:8000/mcp")
@@ -1,10 +1,28 @@
 """Tools package for FastMCP server."""
 
-from .math_tools import register_math_tools
-from .pinecone_tools.pinecone_config import pinecone_config
-from .resources import register_resources
-from .rag_tools.rag_retrical import rag_retrival
-from .rag_tools.rag_store import rag_store
-from .web_search_tools import web_search_tools
-
-__all__ = ['register_math_tools', 'pinecone_config', 'register_resources', 'rag_retrival', 'rag_store', 'web_search_tools', 'web_search_with_content', 'scrape_url'] 
\ No newline at end of file
+import importlib
+
+# Lazy submodule loading (PEP 562): the Pinecone/OpenAI/search SDKs behind
+# these registrars are expensive to import, so each one is only imported the
+# first time its registrar is actually referenced.
+_LAZY = {
+    'register_math_tools': 'math_tools',
+    'pinecone_config': 'pinecone_tools.pinecone_config',
+    'register_resources': 'resources',
+    'rag_retrival': 'rag_tools.rag_retrical',
+    'rag_store': 'rag_tools.rag_store',
+    'web_search_tools': 'web_search_tools',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module('.' + module_name, __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr
+    return attr
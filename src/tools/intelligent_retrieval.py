@@ -7,118 +7,169 @@ This module integrates with existing RAG tools to provide seamless automatic ret
 
 import re
 import asyncio
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from mcp.server.fastmcp import FastMCP
 
+from .rag_tools.rag_retrical import pinecone_retrieve
+
+
+# Intent/domain keywords matched with a dictionary-backed multi-phrase
+# matcher instead of regex alternations: the query is tokenized once and each
+# token position does O(1) hash lookups for 1-3 word grams, so classification
+# is linear in query length regardless of how many keywords are listed.
+_INTENT_KEYWORDS = {
+    "knowledge": (
+        "what is", "what are", "tell me about", "explain", "describe",
+        "how does", "how do", "how to", "how can", "why", "when", "where", "who",
+        "definition of", "meaning of", "concept of",
+    ),
+    "research": (
+        "find", "search", "lookup", "get information", "research",
+        "show me", "give me", "provide", "fetch",
+        "details about", "data on", "information on",
+    ),
+    "analysis": (
+        "analyze", "compare", "review", "summarize", "evaluate",
+        "differences between", "similarities between",
+        "pros and cons", "advantages", "disadvantages",
+    ),
+    "examples": (
+        "example", "sample", "demonstration", "show example",
+        "code example", "implementation example",
+    ),
+}
+
+_DOMAIN_KEYWORDS = {
+    "technical": (
+        "api", "function", "class", "method", "algorithm", "code", "programming",
+        "implementation", "framework", "library", "database", "server",
+        "error", "bug", "debug", "test", "deployment",
+    ),
+    "business": (
+        "strategy", "market", "revenue", "cost", "profit", "customer",
+        "business", "management", "operations", "sales", "marketing",
+    ),
+    "code": (
+        "python", "javascript", "java", "react", "node", "sql", "html", "css",
+        "function", "class", "variable", "loop", "condition", "import",
+    ),
+}
+
+
+def _build_phrase_table(groups: Dict[str, tuple]) -> Dict[tuple, str]:
+    """Map word-tuples to their label; first label listed wins on collisions"""
+    table = {}
+    for label, phrases in groups.items():
+        for phrase in phrases:
+            table.setdefault(tuple(phrase.split()), label)
+    return table
+
+
+# Explicit domain precedence, most specific first: "function"/"class" belong
+# to code rather than the broader technical bucket. Relying on dict literal
+# order made this precedence an accident of formatting.
+_DOMAIN_ORDER = ("code", "technical", "business")
+
+_INTENT_PHRASES = _build_phrase_table(_INTENT_KEYWORDS)
+_DOMAIN_PHRASES = _build_phrase_table({label: _DOMAIN_KEYWORDS[label] for label in _DOMAIN_ORDER})
+_MAX_PHRASE_WORDS = max(len(gram) for gram in (*_INTENT_PHRASES, *_DOMAIN_PHRASES))
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _match_keywords(tokens: List[str], check_domain: bool = True) -> Tuple[Optional[str], Optional[str]]:
+    """Single pass over the token list; returns the leftmost intent and domain hits"""
+    intent = domain = None
+    domain_pending = check_domain
+    n = len(tokens)
+    for i in range(n):
+        if intent is not None and not domain_pending:
+            break
+        for length in range(min(_MAX_PHRASE_WORDS, n - i), 0, -1):
+            gram = tuple(tokens[i:i + length])
+            if intent is None and gram in _INTENT_PHRASES:
+                intent = _INTENT_PHRASES[gram]
+            if domain_pending and gram in _DOMAIN_PHRASES:
+                domain = _DOMAIN_PHRASES[gram]
+                domain_pending = False
+    return intent, domain
+
+QUESTION_WORDS_RE = re.compile(r"\b(what|how|why|when|where|who)\b")
+SPECIFIC_WORDS_RE = re.compile(r"\b(specific|exactly|precisely|details)\b")
+
+# Referential pronouns ("tell me more about that") - single tokens, so the
+# check is one set intersection against the already-tokenized query
+_REFERENTIAL_WORDS = frozenset({"that", "it", "this", "they", "those"})
+
+# Complexity tiers indexed branchlessly by (word_count > 3) + (word_count > 8)
+_COMPLEXITY = ("simple", "medium", "complex")
+_TOP_K = (3, 5, 10)
+
+
+@lru_cache(maxsize=1024)
+def analyze_query_intent(query: str) -> Dict[str, any]:
+    """Analyze user query to determine intent and optimal retrieval strategy
+
+    Results are cached per query, so repeat queries (retries, follow-ups)
+    skip the analysis entirely. Callers that modify the result must copy it
+    first to avoid poisoning the cache.
+    """
+    query_lower = query.lower()
+
+    # Check for retrieval triggers and domain in one tokenize-and-scan pass.
+    # One/two-word queries almost never carry domain routing signal, so skip
+    # the domain lookups for them entirely.
+    tokens = _TOKEN_RE.findall(query_lower)
+    word_count = len(tokens)
+    intent_type, domain = _match_keywords(tokens, check_domain=word_count > 2)
+    needs_retrieval = intent_type is not None
+    intent_type = intent_type or "conversational"
+    domain = domain or "general"
+
+    # Determine complexity and parameters via the shared lookup tables - no
+    # per-call dict literals to allocate
+    tier = (word_count > 3) + (word_count > 8)
+    complexity = _COMPLEXITY[tier]
+    top_k = _TOP_K[tier]
+
+    namespace = "" if domain == "general" else domain
+
+    return {
+        "needs_retrieval": needs_retrieval,
+        "intent_type": intent_type,
+        "domain": domain,
+        "complexity": complexity,
+        "suggested_top_k": top_k,
+        "suggested_namespace": namespace,
+        "query_analysis": {
+            "word_count": word_count,
+            "has_question_words": bool(QUESTION_WORDS_RE.search(query_lower)),
+            "has_referential_words": not _REFERENTIAL_WORDS.isdisjoint(tokens),
+            "is_specific": bool(SPECIFIC_WORDS_RE.search(query_lower))
+        }
+    }
+
+
+# Queries longer than this get analyzed on a worker thread so tokenizing a
+# huge pasted document can't stall the event loop; typical chat queries stay
+# inline because a thread hop would cost more than the scan itself
+_EXECUTOR_THRESHOLD = 2048
+
+
+async def _analyze_query_intent_async(query: str) -> Dict[str, any]:
+    """Event-loop-friendly analyze_query_intent for arbitrarily long queries"""
+    if len(query) <= _EXECUTOR_THRESHOLD:
+        return analyze_query_intent(query)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, analyze_query_intent, query)
+
 
 def intelligent_retrieval_coordinator(mcp: FastMCP) -> None:
     """
     Register intelligent retrieval coordinator that automatically triggers RAG workflows
     """
-    
-    # Intent detection patterns
-    KNOWLEDGE_PATTERNS = [
-        r"\b(what is|what are|tell me about|explain|describe)\b",
-        r"\b(how does|how do|how to|how can)\b", 
-        r"\b(why|when|where|who)\b",
-        r"\b(definition of|meaning of|concept of)\b"
-    ]
-    
-    RESEARCH_PATTERNS = [
-        r"\b(find|search|lookup|get information|research)\b",
-        r"\b(show me|give me|provide|fetch)\b",
-        r"\b(details about|data on|information on)\b"
-    ]
-    
-    ANALYSIS_PATTERNS = [
-        r"\b(analyze|compare|review|summarize|evaluate)\b",
-        r"\b(differences between|similarities between)\b",
-        r"\b(pros and cons|advantages|disadvantages)\b"
-    ]
-    
-    EXAMPLE_PATTERNS = [
-        r"\b(example|sample|demonstration|show example)\b",
-        r"\b(code example|implementation example)\b"
-    ]
-    
-    # Domain detection patterns
-    DOMAIN_PATTERNS = {
-        "technical": [
-            r"\b(api|function|class|method|algorithm|code|programming)\b",
-            r"\b(implementation|framework|library|database|server)\b",
-            r"\b(error|bug|debug|test|deployment)\b"
-        ],
-        "business": [
-            r"\b(strategy|market|revenue|cost|profit|customer)\b", 
-            r"\b(business|management|operations|sales|marketing)\b"
-        ],
-        "code": [
-            r"\b(python|javascript|java|react|node|sql|html|css)\b",
-            r"\b(function|class|variable|loop|condition|import)\b"
-        ]
-    }
-    
-    def analyze_query_intent(query: str) -> Dict[str, any]:
-        """Analyze user query to determine intent and optimal retrieval strategy"""
-        query_lower = query.lower()
-        
-        # Check for retrieval triggers
-        needs_retrieval = False
-        intent_type = "conversational"
-        
-        if any(re.search(pattern, query_lower, re.IGNORECASE) for pattern in KNOWLEDGE_PATTERNS):
-            needs_retrieval = True
-            intent_type = "knowledge"
-            
-        elif any(re.search(pattern, query_lower, re.IGNORECASE) for pattern in RESEARCH_PATTERNS):
-            needs_retrieval = True  
-            intent_type = "research"
-            
-        elif any(re.search(pattern, query_lower, re.IGNORECASE) for pattern in ANALYSIS_PATTERNS):
-            needs_retrieval = True
-            intent_type = "analysis"
-            
-        elif any(re.search(pattern, query_lower, re.IGNORECASE) for pattern in EXAMPLE_PATTERNS):
-            needs_retrieval = True
-            intent_type = "examples"
-        
-        # Detect domain
-        domain = "general"
-        for domain_name, patterns in DOMAIN_PATTERNS.items():
-            if any(re.search(pattern, query_lower, re.IGNORECASE) for pattern in patterns):
-                domain = domain_name
-                break
-        
-        # Determine complexity and parameters
-        word_count = len(query.split())
-        complexity = "simple" if word_count <= 3 else "medium" if word_count <= 8 else "complex"
-        
-        top_k = {
-            "simple": 3,
-            "medium": 5, 
-            "complex": 10
-        }.get(complexity, 5)
-        
-        namespace = {
-            "technical": "technical",
-            "code": "code", 
-            "business": "business"
-        }.get(domain, "")
-        
-        return {
-            "needs_retrieval": needs_retrieval,
-            "intent_type": intent_type,
-            "domain": domain,
-            "complexity": complexity,
-            "suggested_top_k": top_k,
-            "suggested_namespace": namespace,
-            "query_analysis": {
-                "word_count": word_count,
-                "has_question_words": bool(re.search(r"\b(what|how|why|when|where|who)\b", query_lower)),
-                "is_specific": bool(re.search(r"\b(specific|exactly|precisely|details)\b", query_lower))
-            }
-        }
-    
+
     @mcp.tool()
     async def intelligent_retrieve(
         query: str, 
@@ -139,13 +190,15 @@ def intelligent_retrieval_coordinator(mcp: FastMCP) -> None:
             Dictionary with retrieval results and metadata about the decision process
         """
         try:
-            # Analyze query intent 
-            analysis = analyze_query_intent(query)
-            
+            # Analyze query intent (shallow copy - the analysis is cached and
+            # must not be mutated in place)
+            analysis = dict(await _analyze_query_intent_async(query))
+
             # Enhanced context analysis if conversation context provided
             if conversation_context:
-                # Check for referential queries ("that", "it", "this")
-                if re.search(r"\b(that|it|this|they|those)\b", query.lower()):
+                # Check for referential queries ("that", "it", "this") - the
+                # cached analysis already looked for them, no re-lower/re-scan
+                if analysis["query_analysis"]["has_referential_words"]:
                     analysis["needs_retrieval"] = True
                     analysis["intent_type"] = "contextual_reference"
                     # Use conversation context to enhance query
@@ -165,40 +218,25 @@ def intelligent_retrieval_coordinator(mcp: FastMCP) -> None:
                     "suggested_response": "direct_answer"
                 }
             
-            # Get the pinecone_retrieve tool from MCP
-            from .rag_tools.rag_retrical import rag_retrival
-            
-            # Import the actual function (this is a bit hacky but works)
-            import importlib.util
-            import sys
-            
-            # Create a temporary module to access the function
-            spec = importlib.util.spec_from_file_location(
-                "rag_module", 
-                "/Users/logic-liar/Documents/AiVi/FastMCP/mcp-server/src/tools/rag_tools/rag_retrical.py"
-            )
-            rag_module = importlib.util.module_from_spec(spec)
-            sys.modules["rag_module"] = rag_module
-            spec.loader.exec_module(rag_module)
-            
-            # Execute retrieval with optimized parameters
+            # Execute retrieval with optimized parameters using the shared
+            # module-level pinecone_retrieve (no per-call module reload)
             retrieval_params = {
                 "index_name": index_name,
-                "namespace": analysis["suggested_namespace"], 
+                "namespace": analysis["suggested_namespace"],
                 "query": enhanced_query,
                 "top_k": analysis["suggested_top_k"]
             }
-            
-            # This is where you'd call your actual pinecone_retrieve function
-            # For now, return the analysis and suggested parameters
+
+            retrieval_result = await pinecone_retrieve(**retrieval_params)
+
             return {
-                "success": True,
+                "success": retrieval_result.get("success", False),
                 "decision": "retrieval_triggered",
                 "intent_analysis": analysis,
                 "retrieval_params": retrieval_params,
                 "enhanced_query": enhanced_query,
-                "message": f"Automatic retrieval triggered for {analysis['intent_type']} query in {analysis['domain']} domain",
-                "next_action": "call_pinecone_retrieve_with_params"
+                "retrieval_result": retrieval_result,
+                "message": f"Automatic retrieval triggered for {analysis['intent_type']} query in {analysis['domain']} domain"
             }
             
         except Exception as e:
@@ -229,7 +267,7 @@ def intelligent_retrieval_coordinator(mcp: FastMCP) -> None:
         """
         try:
             # Step 1: Intent Analysis
-            analysis = analyze_query_intent(query)
+            analysis = await _analyze_query_intent_async(query)
             
             # Step 2: Auto-trigger retrieval if needed
             if analysis["needs_retrieval"]:
@@ -285,8 +323,8 @@ def intelligent_retrieval_coordinator(mcp: FastMCP) -> None:
         Returns:
             Detailed analysis of query intent and suggested actions
         """
-        analysis = analyze_query_intent(query)
-        
+        analysis = await _analyze_query_intent_async(query)
+
         return {
             "query": query,
             "analysis": analysis,
@@ -0,0 +1,61 @@
+"""Shared Pinecone gRPC client for all tool modules."""
+
+import asyncio
+import threading
+import time
+
+from pinecone.grpc import PineconeGRPC as Pinecone
+
+from config import get_config
+
+# One client - and therefore one gRPC channel, TLS handshake and connection
+# pool - shared by every tool module instead of three independent ones
+pc = Pinecone(api_key=get_config().pinecone_api_key)
+
+# Index handles and has_index answers live here, next to the client, so a
+# create_index/delete_index in one tool module invalidates what every other
+# module sees instead of leaving per-module caches stale
+_index_cache: dict = {}
+_has_index_cache: dict = {}
+_has_index_ttl = 60.0
+
+
+async def get_index(index_name: str):
+    """Resolve an index to a gRPC handle, reusing handles across calls."""
+    index = _index_cache.get(index_name)
+    if index is None:
+        index = await asyncio.to_thread(pc.Index, index_name)
+        _index_cache[index_name] = index
+    return index
+
+
+async def has_index(index_name: str) -> bool:
+    """Answer pc.has_index, reusing answers for a short while."""
+    cached = _has_index_cache.get(index_name)
+    now = time.monotonic()
+    if cached is not None and now - cached[1] < _has_index_ttl:
+        return cached[0]
+    exists = await asyncio.to_thread(pc.has_index, index_name)
+    _has_index_cache[index_name] = (exists, now)
+    return exists
+
+
+def invalidate_index(index_name: str) -> None:
+    """Drop cached state for an index after it is created or deleted."""
+    _index_cache.pop(index_name, None)
+    _has_index_cache.pop(index_name, None)
+
+
+def warm_channel() -> None:
+    """Complete the TLS/HTTP2 handshake before the first user query.
+
+    Issues a best-effort no-op request on a daemon thread so server startup
+    is not blocked and a misconfigured key still surfaces on the real call.
+    """
+    def _warm():
+        try:
+            pc.list_indexes()
+        except Exception:
+            pass
+
+    threading.Thread(target=_warm, name="pinecone-warmup", daemon=True).start()
@@ -1,20 +1,18 @@
 """RAG tools for FastMCP server."""
 
 from mcp.server.fastmcp import FastMCP
-from pinecone.grpc import PineconeGRPC as Pinecone
 from pinecone import ServerlessSpec
 import os
-import dotenv
 import asyncio
 
-dotenv.load_dotenv()
+from config import get_config
+from ._client import pc, get_index, invalidate_index
 
 
 def pinecone_config(mcp: FastMCP) -> None:
     """Register all RAG-related tools with the MCP server."""
-    
-    pc = Pinecone(api_key=os.getenv('PINECONE_API_KEY'))
-    embedding_dimension = int(os.getenv('EMBEDDING_DIMENSION' , 3072))
+
+    embedding_dimension = get_config().embedding_dimension
 
     @mcp.tool()
     async def create_index(index_name: str) -> dict:
@@ -29,10 +27,13 @@ def pinecone_config(mcp: FastMCP) -> None:
         print(f"Creating index {index_name}")
         if not await asyncio.to_thread(pc.has_index, index_name):
             try:
-                await asyncio.to_thread(pc.create_index, name=index_name, 
-                                spec=spec, 
-                                dimension=embedding_dimension, 
+                await asyncio.to_thread(pc.create_index, name=index_name,
+                                spec=spec,
+                                dimension=embedding_dimension,
                                 vector_type="dense")
+                # Drop any cached "does not exist" answer so the rag tools
+                # see the new index immediately
+                invalidate_index(index_name)
                 return {"message": f"Index {index_name} created successfully"}
             except Exception as e:
                 return {"message": f"Error creating index: {e}"}
@@ -49,6 +50,7 @@ def pinecone_config(mcp: FastMCP) -> None:
         if await asyncio.to_thread(pc.has_index, index_name):
             try:
                 await asyncio.to_thread(pc.delete_index, index_name)
+                invalidate_index(index_name)
                 return {"message": f"Index {index_name} deleted successfully"}
             except Exception as e:
                 return {"message": f"Error creating index: {e}"}
@@ -98,17 +100,19 @@ def pinecone_config(mcp: FastMCP) -> None:
             return {"message": f"Index {index_name} does not exist"}
         
         try:
-            # Get the index object
-            index = await asyncio.to_thread(pc.Index, index_name)
+            # Get the index object (cached handle after the first resolution)
+            index = await get_index(index_name)
             
-            # List namespaces using the generator function
-            namespace_list = []
-            for namespace in await asyncio.to_thread(lambda: list(index.list_namespaces())):
-                namespace_list.append({
+            # Drain the namespace generator and project the fields inside the
+            # worker thread, so lazy attribute access never blocks the loop
+            namespace_list = await asyncio.to_thread(lambda: [
+                {
                     "name": namespace.name,
                     "record_count": namespace.record_count
-                })
-            
+                }
+                for namespace in index.list_namespaces()
+            ])
+
             return {"namespaces": namespace_list}
         except Exception as e:
             return {"message": f"Error listing namespaces: {e}"}
@@ -1,22 +1,22 @@
-from config import Config
-from pinecone.grpc import PineconeGRPC as Pinecone
-from openai import OpenAI
+from config import get_config
+from openai import AsyncOpenAI
 from mcp.server.fastmcp import FastMCP
 import asyncio
+import hashlib
 import os
-import dotenv
 
-dotenv.load_dotenv()
+from ..pinecone_tools._client import get_index, has_index
 
 
 def rag_store(mcp: FastMCP) -> None:
     """Store documents in Pinecone"""
-    config = Config()
-    openai_client = OpenAI(api_key=config.openai_api_key)
-    pc = Pinecone(api_key=config.pinecone_api_key)
-    embedding_dimension = int(config.embedding_dimension) if config.embedding_dimension else 3072
+    config = get_config()
+    openai_client = AsyncOpenAI(api_key=config.openai_api_key)
+    embedding_dimension = config.embedding_dimension
     embedding_model = config.embedding_model or "text-embedding-3-small"
-    
+    batch_size = 96  # vectors per embed/upsert batch
+    max_concurrent_batches = 8
+
     @mcp.tool()
     async def pinecone_store(index_name: str, namespace: str, documents: list[dict]) -> dict:
         """Store documents in Pinecone with embeddings
@@ -54,7 +54,7 @@ def rag_store(mcp: FastMCP) -> None:
                 }
             
             # Check if index exists
-            if not await asyncio.to_thread(pc.has_index, index_name):
+            if not await has_index(index_name):
                 return {
                     "success": False,
                     "error": f"Index '{index_name}' does not exist",
@@ -67,7 +67,12 @@ def rag_store(mcp: FastMCP) -> None:
                 if not isinstance(doc, dict) or 'content' not in doc:
                     continue
                 if not doc.get('id'):
-                    doc['id'] = f"doc_{len(valid_documents)}_{hash(doc['content']) % 10000}"
+                    # Content-hash IDs are deterministic across processes, so
+                    # re-running the same ingest updates vectors in place
+                    # instead of creating colliding duplicates (builtin hash()
+                    # is randomized per process and % 10000 collides trivially)
+                    content_hash = hashlib.blake2b(doc['content'].encode(), digest_size=16).hexdigest()
+                    doc['id'] = f"doc_{content_hash}"
                 valid_documents.append(doc)
             
             if not valid_documents:
@@ -77,48 +82,93 @@ def rag_store(mcp: FastMCP) -> None:
                     "total_documents": 0
                 }
             
-            # Convert documents to embeddings using OpenAI
-            try:
-                embedding_response = await asyncio.to_thread(
-                    openai_client.embeddings.create,
-                    input=[doc['content'] for doc in valid_documents],
-                    model=embedding_model
-                )
-            except Exception as embedding_error:
-                return {
-                    "success": False,
-                    "error": f"Failed to create embeddings: {str(embedding_error)}",
-                    "total_documents": 0
-                }
-            
-            # Get the index
-            index = await asyncio.to_thread(pc.Index, index_name)
-            
-            # Prepare vectors for Pinecone upsert
-            vectors = []
-            for i, doc in enumerate(valid_documents):
-                vector_data = {
-                    "id": doc['id'],
-                    "values": embedding_response.data[i].embedding,
-                    "metadata": {
-                        "text": doc['content'],
-                        **doc.get('metadata', {})
-                    }
-                }
-                vectors.append(vector_data)
-            
-            # Store embeddings in Pinecone
+            # Chunk the documents so no single OpenAI call or Pinecone upsert
+            # grows unbounded (Pinecone recommends <=100 vectors per upsert at
+            # this dimension), and pipeline the batches: each one embeds then
+            # upserts as soon as its embeddings resolve, with a semaphore
+            # bounding how many are in flight at once. The index handle is
+            # resolved concurrently with the first embedding batches.
+            # Embed each distinct content string once - duplicate documents
+            # (common after cleaning/normalization) share the embedding and
+            # only pay for their own upsert entry
+            unique_texts = list(dict.fromkeys(doc['content'] for doc in valid_documents))
+            docs_by_text: dict = {}
+            for doc in valid_documents:
+                docs_by_text.setdefault(doc['content'], []).append(doc)
+
+            batches = [unique_texts[i:i + batch_size]
+                       for i in range(0, len(unique_texts), batch_size)]
+            index_task = asyncio.ensure_future(get_index(index_name))
+            semaphore = asyncio.Semaphore(max_concurrent_batches)
+
+            async def _store_batch(texts: list[str]) -> dict:
+                async with semaphore:
+                    try:
+                        embedding_response = await openai_client.embeddings.create(
+                            input=texts,
+                            model=embedding_model
+                        )
+                    except Exception as embedding_error:
+                        raise RuntimeError(f"Failed to create embeddings: {str(embedding_error)}") from embedding_error
+
+                    index = await index_task
+
+                    # Prepare vectors for Pinecone upsert - every document
+                    # with this content gets the shared embedding. Documents
+                    # without metadata skip the dict merge entirely.
+                    vectors = []
+                    for i, text in enumerate(texts):
+                        embedding = embedding_response.data[i].embedding
+                        for doc in docs_by_text[text]:
+                            md = doc.get('metadata')
+                            vector_data = {
+                                "id": doc['id'],
+                                "values": embedding,
+                                "metadata": {"text": text, **md} if md else {"text": text}
+                            }
+                            vectors.append(vector_data)
+
+                    # Store embeddings in Pinecone
+                    try:
+                        await asyncio.to_thread(
+                            index.upsert,
+                            vectors=vectors,
+                            namespace=namespace if namespace else ""
+                        )
+                    except Exception as upsert_error:
+                        raise RuntimeError(f"Failed to upsert to Pinecone: {str(upsert_error)}") from upsert_error
+
+                    return {"vectors_stored": len(vectors)}
+
+            batch_tasks = [asyncio.ensure_future(_store_batch(texts)) for texts in batches]
             try:
-                await asyncio.to_thread(
-                    index.upsert,
-                    vectors=vectors,
-                    namespace=namespace if namespace else ""
+                batch_results = await asyncio.gather(*batch_tasks)
+            except Exception as batch_error:
+                # Catch everything: _store_batch raises RuntimeError for
+                # embed/upsert failures, but a failed index resolution
+                # surfaces here as the raw SDK exception via index_task.
+                # gather returns on the first failure but leaves the other
+                # batches running - cancel them so nothing keeps upserting
+                # after the error response, then wait for everything
+                # (including index_task) to settle so no dead task warns
+                # about an unretrieved exception
+                for task in batch_tasks:
+                    task.cancel()
+                index_task.cancel()
+                await asyncio.gather(*batch_tasks, index_task, return_exceptions=True)
+                # Batches that finished before the failure have already been
+                # stored; surface that instead of claiming nothing landed
+                vectors_stored = sum(
+                    task.result()["vectors_stored"]
+                    for task in batch_tasks
+                    if not task.cancelled() and task.exception() is None
                 )
-            except Exception as upsert_error:
                 return {
                     "success": False,
-                    "error": f"Failed to upsert to Pinecone: {str(upsert_error)}",
-                    "total_documents": 0
+                    "error": str(batch_error),
+                    "total_documents": 0,
+                    "vectors_stored": vectors_stored,
+                    "partial": vectors_stored > 0
                 }
 
             return {
@@ -128,15 +178,17 @@ def rag_store(mcp: FastMCP) -> None:
                     "index_name": index_name,
                     "namespace": namespace if namespace else "default",
                     "embedding_model": embedding_model,
-                    "embedding_dimension": len(embedding_response.data[0].embedding)
+                    "embedding_dimension": embedding_dimension
                 },
                 "storage_metadata": {
                     "documents_processed": len(valid_documents),
-                    "vectors_stored": len(vectors),
+                    "unique_contents_embedded": len(unique_texts),
+                    "vectors_stored": sum(r["vectors_stored"] for r in batch_results),
+                    "batches": len(batches),
                     "namespace_used": namespace if namespace else "default"
                 }
             }
-            
+
         except Exception as e:
             return {
                 "success": False,
@@ -3,7 +3,13 @@ import aiosqlite
 import asyncio
 import os
 import logging
-from typing import List, Dict, Any, Optional
+import re
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import functools
+import inspect
+from typing import List, Dict, Any, Optional, Union
 import json
 from pathlib import Path
 
@@ -12,54 +18,377 @@ logger = logging.getLogger(__name__)
 # Database configuration
 DB_PATH = os.getenv("SQL_DATABASE_PATH", "./data/fastmcp.db")
 
+# Connection tuning: WAL lets readers run while a writer commits,
+# synchronous=NORMAL drops the per-commit fsync WAL doesn't need, and the
+# rest trade memory for fewer disk hits
+_WRITER_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",      # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",    # 256 MiB mmap window
+    "PRAGMA busy_timeout=5000",
+)
+
+# Read-only connections inherit the WAL journal from the database file and
+# cannot issue journal/synchronous writes themselves
+_READER_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",      # 16 MiB per reader
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# sqlite3 keeps a per-connection LRU of compiled statements keyed by the
+# exact SQL text (size set via cached_statements= below). Whitespace or
+# formatting differences miss that cache, so normalize the text first; the
+# normalization itself is memoized so repeated tool calls pay it once.
+# Queries carrying a quote are passed through untouched - collapsing
+# whitespace inside a string literal would silently change its value.
+@lru_cache(maxsize=128)
+def _normalize_sql(query: str) -> str:
+    if "'" in query or '"' in query:
+        return query
+    return ' '.join(query.split())
+
+
+# Statements that change the schema and must invalidate the table/schema caches
+_DDL_RE = re.compile(r"^\s*(CREATE|DROP|ALTER)\b", re.IGNORECASE)
+
+# Word-boundary matches so a table legitimately named e.g. "preselected"
+# is not mistaken for a SELECT query
+_SQL_TOKEN_RE = re.compile(r"\b(select|from|where|order|group|join|union|with)\b", re.IGNORECASE)
+_HAS_LIMIT_RE = re.compile(r"\blimit\b", re.IGNORECASE)
+
+# Table and column names arrive from tool arguments, so they can't be bound
+# as ? parameters - validate and quote them instead. Rejecting anything that
+# isn't a plain identifier both blocks injection and keeps the generated SQL
+# text stable, so the statement cache actually hits.
+_IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,63}$")
+
+
+def _ident(name: str) -> str:
+    """Validate and quote a table/column identifier for interpolation"""
+    if not _IDENT_RE.match(name):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return f'"{name}"'
+
+
+# Column types can't be bound as parameters either. Each whitespace-separated
+# token must be a bare word, a number, or a word with a numeric size suffix -
+# enough for "INTEGER PRIMARY KEY", "TEXT NOT NULL", "VARCHAR(255)" or
+# "REAL DEFAULT 0", while quotes, semicolons and stray parentheses are out.
+_TYPE_TOKEN_RE = re.compile(r"^(?:[A-Za-z_][A-Za-z0-9_]*(?:\(\d+(?:,\d+)?\))?|\d+(?:\.\d+)?)$")
+
+
+def _column_type(type_text: str) -> str:
+    """Validate a column type/constraint string for interpolation"""
+    tokens = type_text.split()
+    if not tokens or not all(_TYPE_TOKEN_RE.match(token) for token in tokens):
+        raise ValueError(f"Invalid column type: {type_text!r}")
+    return ' '.join(tokens)
+
+
+# Query text per (table, columns) shape is deterministic - memoize it so
+# repeated inserts/updates against the same shape skip the join/format work
+# entirely. Callers pass sorted column tuples, which also lets key-order
+# variants of the same record share one cache entry and one compiled
+# statement on the SQLite side.
+@lru_cache(maxsize=256)
+def _build_insert(table: str, cols: tuple) -> str:
+    placeholders = ','.join('?' * len(cols))
+    return f"INSERT INTO {_ident(table)} ({','.join(map(_ident, cols))}) VALUES ({placeholders})"
+
+
+@lru_cache(maxsize=256)
+def _build_update(table: str, set_cols: tuple, where_cols: tuple) -> str:
+    set_clause = ','.join(f"{_ident(col)} = ?" for col in set_cols)
+    where_clause = ' AND '.join(f"{_ident(col)} = ?" for col in where_cols)
+    return f"UPDATE {_ident(table)} SET {set_clause} WHERE {where_clause}"
+
+
+# All of a table's metadata in one round-trip via SQLite's table-valued
+# PRAGMA functions. The three row shapes are padded to a common width so
+# UNION ALL accepts them; _DETAIL_FIELDS maps them back to named dicts.
+_TABLE_DETAILS_SQL = """
+    SELECT 'col' AS kind, cid AS f1, name AS f2, type AS f3, "notnull" AS f4,
+           dflt_value AS f5, pk AS f6, NULL AS f7, NULL AS f8
+    FROM pragma_table_info(?1)
+    UNION ALL
+    SELECT 'fk', id, seq, "table", "from", "to", on_update, on_delete, "match"
+    FROM pragma_foreign_key_list(?1)
+    UNION ALL
+    SELECT 'idx', seq, name, "unique", origin, partial, NULL, NULL, NULL
+    FROM pragma_index_list(?1)
+"""
+
+_DETAIL_FIELDS = {
+    'col': ('cid', 'name', 'type', 'notnull', 'dflt_value', 'pk'),
+    'fk': ('id', 'seq', 'table', 'from', 'to', 'on_update', 'on_delete', 'match'),
+    'idx': ('seq', 'name', 'unique', 'origin', 'partial'),
+}
+
+
 class DatabaseManager:
-    """Manages SQLite database connections and operations"""
-    
-    def __init__(self, db_path: str = DB_PATH):
+    """Manages SQLite database connections and operations.
+
+    Holds a 1-writer / N-reader pool: one read-write connection serialized by
+    a lock (SQLite only supports a single writer anyway), plus a queue of
+    read-only connections so SELECTs run in parallel under WAL.
+    """
+
+    def __init__(self, db_path: str = DB_PATH, reader_count: int = 4):
         self.db_path = db_path
+        self.reader_count = reader_count
         # Create directory if it doesn't exist
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-    
-    async def get_connection(self):
-        """Get database connection"""
-        return aiosqlite.connect(self.db_path)
-    
+        # Long-lived connections shared by every tool call - opening a new
+        # aiosqlite connection spawns a thread and rebuilds the page cache
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._writer_lock = asyncio.Lock()
+        self._readers: Optional[asyncio.Queue] = None
+        self._pool_lock = asyncio.Lock()
+        # Schema metadata rarely changes, so cache it and bump the version on
+        # any DDL statement; row counts change often, so they only get a TTL
+        self._schema_version = 0
+        self._tables_cache: Optional[tuple] = None       # (version, tables)
+        self._schema_cache: Dict[str, tuple] = {}        # table -> (version, schema)
+        self._details_cache: Dict[str, tuple] = {}       # table -> (version, details)
+        self._count_cache: Dict[str, tuple] = {}         # table -> (count, timestamp)
+        self._count_ttl = 5.0
+
+    async def _ensure_writer(self) -> aiosqlite.Connection:
+        """Open the shared read-write connection on first use.
+
+        Only call while holding ``_writer_lock``.
+        """
+        if self._writer is None:
+            conn = await aiosqlite.connect(self.db_path, cached_statements=256)
+            conn.row_factory = aiosqlite.Row
+            for pragma in _WRITER_PRAGMAS:
+                await conn.execute(pragma)
+            self._writer = conn
+        return self._writer
+
+    async def _ensure_readers(self) -> asyncio.Queue:
+        """Open the read-only connection pool on first use"""
+        if self._readers is None:
+            async with self._pool_lock:
+                if self._readers is None:
+                    # Open the writer first so the database file (and WAL
+                    # journal) exist before mode=ro connections try to attach
+                    async with self._writer_lock:
+                        await self._ensure_writer()
+                    readers: asyncio.Queue = asyncio.Queue()
+                    for _ in range(self.reader_count):
+                        conn = await aiosqlite.connect(
+                            f"file:{self.db_path}?mode=ro", uri=True,
+                            cached_statements=256
+                        )
+                        conn.row_factory = aiosqlite.Row
+                        for pragma in _READER_PRAGMAS:
+                            await conn.execute(pragma)
+                        readers.put_nowait(conn)
+                    self._readers = readers
+        return self._readers
+
+    @asynccontextmanager
+    async def acquire_reader(self):
+        """Borrow a read-only connection from the pool"""
+        readers = await self._ensure_readers()
+        conn = await readers.get()
+        try:
+            yield conn
+        finally:
+            readers.put_nowait(conn)
+
+    @asynccontextmanager
+    async def acquire_writer(self):
+        """Borrow the single read-write connection"""
+        async with self._writer_lock:
+            yield await self._ensure_writer()
+
+    async def close(self) -> None:
+        """Close all pooled connections (call at server shutdown)"""
+        if self._readers is not None:
+            while not self._readers.empty():
+                await self._readers.get_nowait().close()
+            self._readers = None
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+
     async def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Execute SELECT query and return results"""
-        async with await self.get_connection() as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(query, params) as cursor:
+        async with self.acquire_reader() as db:
+            async with db.execute(_normalize_sql(query), params) as cursor:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
-    
+
+    async def execute_query_rows(self, query: str, params: tuple = ()) -> tuple:
+        """Execute SELECT and return (columns, rows) without per-row dicts.
+
+        For result sets hundreds of rows deep, the dict-per-row copies (and
+        the repeated key strings they drag into the JSON payload) dominate -
+        one column header plus plain row lists is much cheaper to build and
+        serialize.
+        """
+        async with self.acquire_reader() as db:
+            async with db.execute(_normalize_sql(query), params) as cursor:
+                rows = await cursor.fetchall()
+                columns = [d[0] for d in cursor.description] if cursor.description else []
+                return columns, [list(row) for row in rows]
+
     async def execute_modification(self, query: str, params: tuple = ()) -> Dict[str, Any]:
         """Execute INSERT, UPDATE, DELETE queries"""
-        async with await self.get_connection() as db:
-            cursor = await db.execute(query, params)
-            await db.commit()
+        async with self.acquire_writer() as db:
+            # BEGIN IMMEDIATE takes the write lock up front, skipping the
+            # deferred->reserved upgrade that raises SQLITE_BUSY under load.
+            # Roll back on failure so the shared connection never stays stuck
+            # inside a dead transaction.
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = await db.execute(_normalize_sql(query), params)
+                await db.commit()
+            except BaseException:
+                await db.rollback()
+                raise
+            self._invalidate_caches(query)
             return {
                 "rows_affected": cursor.rowcount,
                 "last_row_id": cursor.lastrowid
             }
+
+    async def execute_many(self, query: str, params_seq: List[tuple]) -> Dict[str, Any]:
+        """Execute one statement for many parameter rows in a single transaction"""
+        async with self.acquire_writer() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = await db.executemany(_normalize_sql(query), params_seq)
+                await db.commit()
+            except BaseException:
+                await db.rollback()
+                raise
+            self._invalidate_caches(query)
+            return {
+                "rows_affected": cursor.rowcount,
+                "last_row_id": cursor.lastrowid
+            }
+
+    def _invalidate_caches(self, query: str) -> None:
+        """Drop cached metadata made stale by a completed write"""
+        if _DDL_RE.match(query):
+            self._schema_version += 1
+        self._count_cache.clear()
     
     async def get_tables(self) -> List[str]:
-        """Get list of all tables in database"""
+        """Get list of all tables in database (cached until the next DDL)"""
+        if self._tables_cache is not None and self._tables_cache[0] == self._schema_version:
+            return self._tables_cache[1]
         query = "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
         result = await self.execute_query(query)
-        return [row['name'] for row in result]
-    
+        tables = [row['name'] for row in result]
+        self._tables_cache = (self._schema_version, tables)
+        return tables
+
     async def get_table_schema(self, table_name: str) -> List[Dict[str, str]]:
-        """Get table schema information"""
-        query = f"PRAGMA table_info({table_name})"
-        return await self.execute_query(query)
+        """Get table schema information (cached until the next DDL)"""
+        cached = self._schema_cache.get(table_name)
+        if cached is not None and cached[0] == self._schema_version:
+            return cached[1]
+        query = f"PRAGMA table_info({_ident(table_name)})"
+        schema = await self.execute_query(query)
+        self._schema_cache[table_name] = (self._schema_version, schema)
+        return schema
+
+    async def get_table_details(self, table_name: str) -> Dict[str, Any]:
+        """Get columns, foreign keys and indexes in one query (cached until DDL).
+
+        One prepared statement and one round-trip instead of a dispatch per
+        PRAGMA; rows are split back out by their kind tag.
+        """
+        cached = self._details_cache.get(table_name)
+        if cached is not None and cached[0] == self._schema_version:
+            return cached[1]
+        rows = await self.execute_query(_TABLE_DETAILS_SQL, (table_name,))
+        details: Dict[str, Any] = {"columns": [], "foreign_keys": [], "indexes": []}
+        buckets = {
+            'col': details["columns"],
+            'fk': details["foreign_keys"],
+            'idx': details["indexes"],
+        }
+        for row in rows:
+            values = list(row.values())
+            fields = _DETAIL_FIELDS[values[0]]
+            buckets[values[0]].append(dict(zip(fields, values[1:])))
+        self._details_cache[table_name] = (self._schema_version, details)
+        return details
+
+    async def get_estimated_row_count(self, table_name: str) -> Optional[int]:
+        """O(1) row-count estimate from ANALYZE statistics, or None if absent.
+
+        SELECT COUNT(*) scans the whole table; sqlite_stat1 stores the row
+        count ANALYZE observed as the first token of its stat column.
+        """
+        try:
+            rows = await self.execute_query(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = ? LIMIT 1", (table_name,)
+            )
+        except Exception:
+            # sqlite_stat1 does not exist until ANALYZE has run at least once
+            return None
+        if not rows:
+            return None
+        try:
+            return int(rows[0]['stat'].split()[0])
+        except (AttributeError, IndexError, ValueError):
+            return None
+
+    async def get_row_count(self, table_name: str) -> int:
+        """Get a table's row count, reusing answers for a few seconds"""
+        cached = self._count_cache.get(table_name)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < self._count_ttl:
+            return cached[0]
+        result = await self.execute_query(f"SELECT COUNT(*) as count FROM {_ident(table_name)}")
+        count = result[0]['count'] if result else 0
+        self._count_cache[table_name] = (count, now)
+        return count
 
 # Global database manager instance
 db_manager = DatabaseManager()
 
+
+def _sql_tool(fn):
+    """Uniform error handling for SQL tools.
+
+    Every tool carried an identical try/except-log-return block; this applies
+    it once. On failure the tool's arguments are folded into the error payload
+    so callers keep their context fields (table name, data, conditions).
+    """
+    sig = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            logger.error("%s failed: %s", fn.__name__, e)
+            error: Dict[str, Any] = {"success": False, "error": str(e)}
+            try:
+                error.update(sig.bind(*args, **kwargs).arguments)
+            except TypeError:
+                pass
+            return error
+
+    return wrapper
+
+
 def basic_mcp(mcp: FastMCP) -> None:
     """Register basic SQL tools with the MCP server"""
 
     @mcp.tool()
+    @_sql_tool
     async def sql_query(table: str, limit: int = 100) -> Dict[str, Any]:
         """
         Get all data from a table or execute SELECT query
@@ -67,95 +396,94 @@ def basic_mcp(mcp: FastMCP) -> None:
             table: Table name OR full SELECT query
             limit: Maximum number of rows to return (default: 100)
         """
-        try:
-            table_lower = table.lower().strip()
-            
-            # If it's just a table name (no spaces, no SQL keywords), convert to SELECT *
-            if ' ' not in table_lower and not any(keyword in table_lower for keyword in ['select', 'from', 'where', 'order', 'group']):
-                # It's likely just a table name
-                query = f"SELECT * FROM {table}"
-            else:
-                # It's a full query
-                query = table
-            
-            query_lower = query.lower()
-            
-            # Validate query is SELECT only
-            if not query_lower.startswith('select'):
-                return {
-                    "error": "Only SELECT queries are allowed, or provide a table name to get all data",
-                    "success": False
-                }
-            
-            # Add LIMIT if not present
-            if 'limit' not in query_lower:
-                query = f"{query.rstrip(';')} LIMIT {limit}"
-            
-            # Execute query
-            results = await db_manager.execute_query(query)
-            
-            return {
-                "success": True,
-                "table_or_query": table,
-                "executed_query": query,
-                "results": results,
-                "row_count": len(results),
-                "columns": list(results[0].keys()) if results else []
-            }
-            
-        except Exception as e:
-            logger.error(f"SQL query error: {e}")
+        table = table.strip()
+
+        # If it's just a table name (no spaces, no SQL keywords), convert to SELECT *
+        if ' ' not in table and not _SQL_TOKEN_RE.search(table):
+            # It's likely just a table name
+            query = f"SELECT * FROM {_ident(table)}"
+        else:
+            # It's a full query
+            query = table
+
+        # Validate query is SELECT only
+        if not query.lstrip().lower().startswith('select'):
             return {
-                "error": str(e),
-                "success": False,
-                "table_or_query": table
+                "error": "Only SELECT queries are allowed, or provide a table name to get all data",
+                "success": False
             }
 
+        # Add LIMIT if not present - bound as a parameter so the query
+        # text (and its compiled statement) is the same for every limit
+        params: tuple = ()
+        if not _HAS_LIMIT_RE.search(query):
+            query = f"{query.rstrip(';')} LIMIT ?"
+            params = (limit,)
+
+        # Execute query - columnar form: one columns header, rows as lists
+        columns, rows = await db_manager.execute_query_rows(query, params)
+
+        return {
+            "success": True,
+            "table_or_query": table,
+            "executed_query": query,
+            "results": rows,
+            "row_count": len(rows),
+            "columns": columns
+        }
+
 
     @mcp.tool()
-    async def sql_insert(table: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    @_sql_tool
+    async def sql_insert(table: str, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Dict[str, Any]:
         """
-        Insert new record into table
+        Insert one or many records into table
         Args:
             table: Target table name
-            data: Dictionary of column-value pairs to insert
+            data: Dictionary of column-value pairs, or a list of such
+                  dictionaries (all sharing the same columns) for bulk insert
         """
-        try:
-            if not data:
-                return {
-                    "error": "No data provided for insertion",
-                    "success": False
-                }
-            
-            # Build INSERT query
-            columns = list(data.keys())
-            placeholders = ','.join(['?' for _ in columns])
-            values = tuple(data.values())
-            
-            query = f"INSERT INTO {table} ({','.join(columns)}) VALUES ({placeholders})"
-            
-            # Execute insertion
-            result = await db_manager.execute_modification(query, values)
-            
+        if not data:
             return {
-                "success": True,
-                "table": table,
-                "inserted_data": data,
-                "rows_affected": result['rows_affected'],
-                "last_row_id": result['last_row_id']
+                "error": "No data provided for insertion",
+                "success": False
             }
-            
-        except Exception as e:
-            logger.error(f"SQL insert error: {e}")
+
+        records = data if isinstance(data, list) else [data]
+
+        # Build one INSERT query; all records must share its column set so
+        # they can go through a single executemany transaction. Columns are
+        # sorted so the memoized query text hits for any key order.
+        columns = tuple(sorted(records[0]))
+        if any(tuple(sorted(record)) != columns for record in records[1:]):
             return {
-                "error": str(e),
-                "success": False,
-                "table": table,
-                "data": data
+                "error": "All records must have the same columns for bulk insertion",
+                "success": False
             }
+        query = _build_insert(table, columns)
+
+        # Execute insertion - one commit regardless of record count
+        if len(records) == 1:
+            result = await db_manager.execute_modification(
+                query, tuple(records[0][col] for col in columns)
+            )
+        else:
+            result = await db_manager.execute_many(
+                query, [tuple(record[col] for col in columns) for record in records]
+            )
+
+        return {
+            "success": True,
+            "table": table,
+            "inserted_data": data,
+            "records_inserted": len(records),
+            "rows_affected": result['rows_affected'],
+            "last_row_id": result['last_row_id']
+        }
 
 
     @mcp.tool()
+    @_sql_tool
     async def sql_update(table: str, data: Dict[str, Any], conditions: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update existing records in table
@@ -164,49 +492,39 @@ def basic_mcp(mcp: FastMCP) -> None:
             data: Dictionary of column-value pairs to update
             conditions: Dictionary of WHERE conditions
         """
-        try:
-            if not data:
-                return {
-                    "error": "No data provided for update",
-                    "success": False
-                }
-            
-            if not conditions:
-                return {
-                    "error": "No conditions provided - this would update all rows!",
-                    "success": False
-                }
-            
-            # Build UPDATE query
-            set_clause = ','.join([f"{col} = ?" for col in data.keys()])
-            where_clause = ' AND '.join([f"{col} = ?" for col in conditions.keys()])
-            
-            query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
-            params = tuple(list(data.values()) + list(conditions.values()))
-            
-            # Execute update
-            result = await db_manager.execute_modification(query, params)
-            
+        if not data:
             return {
-                "success": True,
-                "table": table,
-                "updated_data": data,
-                "conditions": conditions,
-                "rows_affected": result['rows_affected']
+                "error": "No data provided for update",
+                "success": False
             }
-            
-        except Exception as e:
-            logger.error(f"SQL update error: {e}")
+
+        if not conditions:
             return {
-                "error": str(e),
-                "success": False,
-                "table": table,
-                "data": data,
-                "conditions": conditions
+                "error": "No conditions provided - this would update all rows!",
+                "success": False
             }
 
+        # Build UPDATE query from the memoized shape; values are ordered to
+        # match the sorted columns the cached text was built from
+        set_cols = tuple(sorted(data))
+        where_cols = tuple(sorted(conditions))
+        query = _build_update(table, set_cols, where_cols)
+        params = tuple(data[col] for col in set_cols) + tuple(conditions[col] for col in where_cols)
+
+        # Execute update
+        result = await db_manager.execute_modification(query, params)
+
+        return {
+            "success": True,
+            "table": table,
+            "updated_data": data,
+            "conditions": conditions,
+            "rows_affected": result['rows_affected']
+        }
+
 
     @mcp.tool()
+    @_sql_tool
     async def sql_delete(table: str, conditions: Dict[str, Any], confirm_delete: bool = False) -> Dict[str, Any]:
         """
         Delete records with safety checks
@@ -215,105 +533,105 @@ def basic_mcp(mcp: FastMCP) -> None:
             conditions: Dictionary of WHERE conditions
             confirm_delete: Must be True to actually delete (safety measure)
         """
-        try:
-            if not conditions:
-                return {
-                    "error": "No conditions provided - this would delete all rows! Use sql_truncate_table for that.",
-                    "success": False
-                }
-            
-            if not confirm_delete:
-                # First, show what would be deleted
-                where_clause = ' AND '.join([f"{col} = ?" for col in conditions.keys()])
-                preview_query = f"SELECT COUNT(*) as count FROM {table} WHERE {where_clause}"
-                params = tuple(conditions.values())
-                
-                count_result = await db_manager.execute_query(preview_query, params)
-                rows_to_delete = count_result[0]['count'] if count_result else 0
-                
-                return {
-                    "success": False,
-                    "preview": True,
-                    "table": table,
-                    "conditions": conditions,
-                    "rows_that_would_be_deleted": rows_to_delete,
-                    "message": f"This would delete {rows_to_delete} rows. Set confirm_delete=True to proceed."
-                }
-            
-            # Build DELETE query
-            where_clause = ' AND '.join([f"{col} = ?" for col in conditions.keys()])
-            query = f"DELETE FROM {table} WHERE {where_clause}"
-            params = tuple(conditions.values())
-            
-            # Execute deletion
-            result = await db_manager.execute_modification(query, params)
-            
+        if not conditions:
             return {
-                "success": True,
-                "table": table,
-                "conditions": conditions,
-                "rows_deleted": result['rows_affected']
+                "error": "No conditions provided - this would delete all rows! Use sql_truncate_table for that.",
+                "success": False
             }
-            
-        except Exception as e:
-            logger.error(f"SQL delete error: {e}")
+
+        if not confirm_delete:
+            # First, show what would be deleted
+            where_clause = ' AND '.join([f"{_ident(col)} = ?" for col in conditions.keys()])
+            preview_query = f"SELECT COUNT(*) as count FROM {_ident(table)} WHERE {where_clause}"
+            params = tuple(conditions.values())
+
+            count_result = await db_manager.execute_query(preview_query, params)
+            rows_to_delete = count_result[0]['count'] if count_result else 0
+
             return {
-                "error": str(e),
                 "success": False,
+                "preview": True,
                 "table": table,
-                "conditions": conditions
+                "conditions": conditions,
+                "rows_that_would_be_deleted": rows_to_delete,
+                "message": f"This would delete {rows_to_delete} rows. Set confirm_delete=True to proceed."
             }
 
+        # Build DELETE query - RETURNING gives the exact deleted rows in
+        # the same statement, so no separate count round-trip is needed
+        # and the reported number can't race a concurrent write
+        where_clause = ' AND '.join([f"{_ident(col)} = ?" for col in conditions.keys()])
+        query = f"DELETE FROM {_ident(table)} WHERE {where_clause} RETURNING rowid"
+        params = tuple(conditions.values())
+
+        # Execute deletion (RETURNING produces rows, so it can't go
+        # through execute_modification)
+        async with db_manager.acquire_writer() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                async with db.execute(query, params) as cursor:
+                    deleted_rows = await cursor.fetchall()
+                await db.commit()
+            except BaseException:
+                await db.rollback()
+                raise
+        # Same invariant as execute_modification: cached row counts are
+        # stale the moment the delete commits
+        db_manager._invalidate_caches(query)
+
+        return {
+            "success": True,
+            "table": table,
+            "conditions": conditions,
+            "rows_deleted": len(deleted_rows)
+        }
+
     @mcp.tool()
+    @_sql_tool
     async def list_tables() -> Dict[str, Any]:
         """
         List all tables in the database
         """
-        try:
-            tables = await db_manager.get_tables()
-            return {
-                "success": True,
-                "tables": tables,
-                "table_count": len(tables)
-            }
-        except Exception as e:
-            logger.error(f"List tables error: {e}")
-            return {
-                "error": str(e),
-                "success": False
-            }
-    
+        tables = await db_manager.get_tables()
+        return {
+            "success": True,
+            "tables": tables,
+            "table_count": len(tables)
+        }
+
     @mcp.tool()
+    @_sql_tool
     async def describe_table(table_name: str) -> Dict[str, Any]:
         """
         Get detailed information about a table's structure
         Args:
             table_name: Name of the table to describe
         """
-        try:
-            schema = await db_manager.get_table_schema(table_name)
-            
-            # Get row count
-            count_query = f"SELECT COUNT(*) as count FROM {table_name}"
-            count_result = await db_manager.execute_query(count_query)
-            row_count = count_result[0]['count'] if count_result else 0
-            
-            return {
-                "success": True,
-                "table_name": table_name,
-                "columns": schema,
-                "column_count": len(schema),
-                "row_count": row_count
-            }
-        except Exception as e:
-            logger.error(f"Describe table error: {e}")
-            return {
-                "error": str(e),
-                "success": False,
-                "table_name": table_name
-            }
-    
+        # Columns, foreign keys and indexes come back from one batched query
+        details = await db_manager.get_table_details(table_name)
+        schema = details["columns"]
+
+        # Prefer the O(1) ANALYZE estimate; a full COUNT(*) scan only
+        # runs when no statistics exist yet (short-TTL cached)
+        estimated = await db_manager.get_estimated_row_count(table_name)
+        if estimated is not None:
+            row_count = estimated
+        else:
+            row_count = await db_manager.get_row_count(table_name)
+
+        return {
+            "success": True,
+            "table_name": table_name,
+            "columns": schema,
+            "column_count": len(schema),
+            "foreign_keys": details["foreign_keys"],
+            "indexes": details["indexes"],
+            "row_count": row_count,
+            "row_count_estimated": estimated is not None
+        }
+
     @mcp.tool()
+    @_sql_tool
     async def create_table(table_name: str, columns: List[Dict[str, str]]) -> Dict[str, Any]:
         """
         Create a new table
@@ -321,43 +639,35 @@ def basic_mcp(mcp: FastMCP) -> None:
             table_name: Name of the new table
             columns: List of column definitions [{'name': 'id', 'type': 'INTEGER PRIMARY KEY'}, ...]
         """
-        try:
-            if not columns:
+        if not columns:
+            return {
+                "error": "No columns provided",
+                "success": False
+            }
+
+        # Build CREATE TABLE query
+        column_definitions = []
+        for col in columns:
+            if 'name' not in col or 'type' not in col:
                 return {
-                    "error": "No columns provided",
+                    "error": "Each column must have 'name' and 'type' fields",
                     "success": False
                 }
-            
-            # Build CREATE TABLE query
-            column_definitions = []
-            for col in columns:
-                if 'name' not in col or 'type' not in col:
-                    return {
-                        "error": "Each column must have 'name' and 'type' fields",
-                        "success": False
-                    }
-                column_definitions.append(f"{col['name']} {col['type']}")
-            
-            query = f"CREATE TABLE {table_name} ({', '.join(column_definitions)})"
-            
-            await db_manager.execute_modification(query)
-            
-            return {
-                "success": True,
-                "table_name": table_name,
-                "columns": columns,
-                "query": query
-            }
-            
-        except Exception as e:
-            logger.error(f"Create table error: {e}")
-            return {
-                "error": str(e),
-                "success": False,
-                "table_name": table_name
-            }
-    
+            column_definitions.append(f"{_ident(col['name'])} {_column_type(col['type'])}")
+
+        query = f"CREATE TABLE {_ident(table_name)} ({', '.join(column_definitions)})"
+
+        await db_manager.execute_modification(query)
+
+        return {
+            "success": True,
+            "table_name": table_name,
+            "columns": columns,
+            "query": query
+        }
+
     @mcp.tool()
+    @_sql_tool
     async def sample_data(table_name: str, limit: int = 5) -> Dict[str, Any]:
         """
         Get a sample of data from a table
@@ -365,21 +675,13 @@ def basic_mcp(mcp: FastMCP) -> None:
             table_name: Name of the table
             limit: Number of sample rows to return (default: 5)
         """
-        try:
-            query = f"SELECT * FROM {table_name} LIMIT {limit}"
-            results = await db_manager.execute_query(query)
-            
-            return {
-                "success": True,
-                "table_name": table_name,
-                "sample_data": results,
-                "sample_count": len(results)
-            }
-            
-        except Exception as e:
-            logger.error(f"Sample data error: {e}")
-            return {
-                "error": str(e),
-                "success": False,
-                "table_name": table_name
-            }
\ No newline at end of file
+        query = f"SELECT * FROM {_ident(table_name)} LIMIT ?"
+        columns, rows = await db_manager.execute_query_rows(query, (limit,))
+
+        return {
+            "success": True,
+            "table_name": table_name,
+            "columns": columns,
+            "sample_data": rows,
+            "sample_count": len(rows)
+        }
\ No newline at end of file
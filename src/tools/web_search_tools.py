@@ -10,16 +10,54 @@ from mcp.server.fastmcp import FastMCP
 
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from duckduckgo_search import DDGS
+from collections import OrderedDict
 from typing import List, Dict, Optional
 import logging
 import re
+import time
 from urllib.parse import urljoin
 
 
 logger = logging.getLogger(__name__)
 
+_SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+_MAX_CONCURRENT_SCRAPES = 8
+
+# Popular URLs (Wikipedia, docs sites) recur across searches - keep their
+# extracted text around for a while so repeats skip the fetch and the parse
+_SCRAPE_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_SCRAPE_CACHE_MAX = 512
+_SCRAPE_CACHE_TTL = 600.0  # seconds
+
+# Parser constants - compiled/built once at import, never per scrape
+_UNWANTED_TAGS = ('script', 'style', 'nav', 'footer', 'aside', 'header', 'form')
+_CONTENT_HINT_RE = re.compile(r'content|article|main', re.I)
+
+# One session for every scrape - a fresh ClientSession per URL means a fresh
+# connector, DNS cache and TCP/TLS handshake each time
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            headers=_SCRAPE_HEADERS,
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared scrape session (call at server shutdown)"""
+    if _session is not None and not _session.closed:
+        await _session.close()
+
 
 
 def web_search_tools(mcp: FastMCP) -> None:
@@ -33,21 +71,19 @@ def web_search_tools(mcp: FastMCP) -> None:
             max_results: The maximum number of results to return
         """
         try:
+            # Format results in a single pass over the iterator instead of
+            # materializing them first and looping again (use the debug_search
+            # tool to inspect raw result structure)
             with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=max_results))
-        
-            formatted_results = []
-            for result in results:
-                # Debug: log the result structure
-                logger.info(f"DuckDuckGo result keys: {result.keys() if isinstance(result, dict) else 'Not a dict'}")
-                
-                formatted_results.append({
-                    "title": result.get("title", "") or result.get("t", ""),
-                    "url": result.get("href", "") or result.get("u", "") or result.get("link", ""),
-                    "snippet": result.get("body", "") or result.get("a", "") or result.get("snippet", ""),
-                    "raw_result": str(result)  # Debug info
-                })
-        
+                formatted_results = [
+                    {
+                        "title": result.get("title", "") or result.get("t", ""),
+                        "url": result.get("href", "") or result.get("u", "") or result.get("link", ""),
+                        "snippet": result.get("body", "") or result.get("a", "") or result.get("snippet", ""),
+                    }
+                    for result in ddgs.text(query, max_results=max_results)
+                ]
+
             return {
                 "query": query,
                 "results": formatted_results,
@@ -82,24 +118,26 @@ def web_search_tools(mcp: FastMCP) -> None:
                 # 2. Scrape content from URLs
                 scraped_content = await scrape_multiple_urls([r["url"] for r in search_results])
                 
+                # Build the enhanced results and the joined summary in one
+                # pass instead of materializing a second filtered list
                 enhanced_results = []
+                content_pieces = []
                 for result in search_results:
                     url = result["url"]
                     content = scraped_content.get(url, "")
-    
+                    content = content[:2000] if content else ""  # Limit content length
+
                     enhanced_results.append({
                         "title": result["title"],
                         "url": url,
                         "snippet": result["snippet"],
-                        "content": content[:2000] if content else "",  # Limit content length
+                        "content": content,
                         "content_available": bool(content)
                     })
-                
-                all_content = "\n\n".join([
-                    f"{r['content']}\nSource: {r['url']}" 
-                    for r in enhanced_results 
-                    if r["content"]
-                ])
+                    if content:
+                        content_pieces.append(f"{content}\nSource: {url}")
+
+                all_content = "\n\n".join(content_pieces)
 
                 # summary = create_summary(all_content, query) if all_content else "No content could be scraped."
 
@@ -164,45 +202,72 @@ def web_search_tools(mcp: FastMCP) -> None:
 
 
 # Helper Functions
+def _parse_html(html: str) -> Optional[str]:
+    """Extract the main text content from an HTML page (CPU-bound)"""
+    # lxml directly, without the BeautifulSoup wrapper layer - the tag walk,
+    # text extraction and element stripping all stay in C
+    tree = lxml_html.fromstring(html)
+    # Remove unwanted elements
+    etree.strip_elements(tree, *_UNWANTED_TAGS, with_tail=False)
+    # Find main content
+    main_content = tree.find('.//main')
+    if main_content is None:
+        main_content = tree.find('.//article')
+    if main_content is None:
+        for div in tree.iter('div'):
+            hint = div.get('class') or div.get('id')
+            if hint and _CONTENT_HINT_RE.search(hint):
+                main_content = div
+                break
+    if main_content is None:
+        main_content = tree.find('.//body')
+    if main_content is not None:
+        # Extract text; str.split/join collapses whitespace in C
+        text = ' '.join(main_content.text_content().split())
+        # Limit length
+        return text[:5000] if len(text) > 5000 else text
+    return None
+
+
 async def scrape_single_url(url: str) -> Optional[str]:
-    """Scrape content from a single URL"""
+    """Scrape content from a single URL (cached by URL for a few minutes)"""
+    cached = _SCRAPE_CACHE.get(url)
+    if cached is not None:
+        if time.monotonic() - cached[0] < _SCRAPE_CACHE_TTL:
+            _SCRAPE_CACHE.move_to_end(url)
+            return cached[1]
+        del _SCRAPE_CACHE[url]
+
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status != 200:
-                    return None
-                html = await response.text()
-                soup = BeautifulSoup(html, 'lxml')
-                # Remove unwanted elements
-                for element in soup(['script', 'style', 'nav', 'footer', 'aside', 'header', 'form']):
-                    element.decompose()
-                # Find main content
-                main_content = (
-                    soup.find('main') or
-                    soup.find('article') or
-                    soup.find('div', class_=re.compile(r'content|article|main', re.I)) or
-                    soup.find('div', id=re.compile(r'content|article|main', re.I)) or
-                    soup.find('body')
-                )
-                if main_content:
-                    # Extract text
-                    text = main_content.get_text(separator=' ', strip=True)
-                    # Clean whitespace
-                    text = re.sub(r'\s+', ' ', text)
-                    # Limit length
-                    return text[:5000] if len(text) > 5000 else text
+        session = _get_session()
+        async with session.get(url) as response:
+            if response.status != 200:
                 return None
+            html = await response.text()
+        # Parsing a big page can take hundreds of milliseconds of pure CPU -
+        # run it on a worker thread so the event loop keeps serving other
+        # tool calls
+        text = await asyncio.get_running_loop().run_in_executor(None, _parse_html, html)
+        if text:
+            # Only successful extractions are cached - failures should retry
+            _SCRAPE_CACHE[url] = (time.monotonic(), text)
+            while len(_SCRAPE_CACHE) > _SCRAPE_CACHE_MAX:
+                _SCRAPE_CACHE.popitem(last=False)
+        return text
     except Exception as e:
         logger.error(f"Failed to scrape {url}: {e}")
         return None
         
         
 async def scrape_multiple_urls(urls: List[str]) -> Dict[str, Optional[str]]:
-    """Scrape content from multiple URLs concurrently"""
-    tasks = [scrape_single_url(url) for url in urls]
+    """Scrape content from multiple URLs concurrently (bounded)"""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SCRAPES)
+
+    async def _bounded_scrape(url: str) -> Optional[str]:
+        async with semaphore:
+            return await scrape_single_url(url)
+
+    tasks = [_bounded_scrape(url) for url in urls]
     results = await asyncio.gather(*tasks, return_exceptions=True)
     scraped_content = {}
     for url, result in zip(urls, results):